@@ -29,6 +29,7 @@ cdef extern from "c_cache.h" namespace "relstorage::cache":
         size_t frequency
         bint in_cache() except +
         vector[TID_t] all_tids() except +
+        TID_t newest_tid()
         # Memory management
         bool can_delete() except +
         const T* Py_use[T]()
@@ -111,6 +111,22 @@ cdef inline CachedValue python_from_entry(const ICacheEntry& entry):
 cdef inline object bytes_from_pickle(const SVCacheEntry_p entry):
     return entry.as_object()
 
+cdef inline tuple newest_value_row(const ICacheEntry& entry):
+    cdef const SVCacheEntry* sve_p = dynamic_cast[SVCacheEntry_p](&entry)
+    cdef SVCacheEntry* newest_p
+    cdef SingleValue newest
+    if sve_p:
+        return (entry.key, sve_p.tid(), sve_p.frozen(),
+                bytes_from_pickle(sve_p), entry.frequency)
+    # Multiple values have to copy out their newest entry,
+    # which the SingleValue then owns.
+    newest_p = dynamic_cast[MVCacheEntry_p](&entry).copy_newest_entry()
+    if not newest_p:
+        raise AssertionError("Value should not be none", entry.key)
+    newest = SingleValue.from_entry(newest_p)
+    return (entry.key, newest.entry.tid(), newest.entry.frozen(),
+            bytes_from_pickle(newest.entry), entry.frequency)
+
 ctypedef fused ConcreteCacheEntry:
     SVCacheEntry_p
     MVCacheEntry_p
@@ -303,16 +319,23 @@ cdef class PyGeneration:
 @cython.final
 cdef class PyCache:
     cdef Cache cache
-    cdef readonly size_t sets
+    # Hits plus sets. This is what the aging check wants, so we
+    # maintain it directly instead of adding two counters on every
+    # set.
+    cdef readonly size_t operations
     cdef readonly size_t hits
     cdef readonly size_t misses
 
     def __cinit__(self, eden, protected, probation):
         self.cache.resize(eden, protected, probation)
-        self.sets = self.hits = self.misses = 0
+        self.operations = self.hits = self.misses = 0
 
     cpdef reset_stats(self):
-        self.hits = self.sets = self.misses = 0
+        self.hits = self.operations = self.misses = 0
+
+    @property
+    def sets(self):
+        return self.operations - self.hits
 
     @property
     def limit(self):
@@ -404,10 +427,36 @@ cdef class PyCache:
 
         if cvalue:
             self.hits += 1
+            self.operations += 1
             return SingleValue.from_entry(cvalue)
 
         self.misses += 1
 
+    cpdef tuple get_state_and_tid(self, OID_t key, tid):
+        """
+        Like ``get_item_with_tid``, but return the ``(state, tid)``
+        tuple directly, without wrapping the entry in a ``SingleValue``.
+        """
+        cdef TID_t native_tid = -1 if tid is None else tid
+        cdef SVCacheEntry_p cvalue = self.cache.get(key, native_tid)
+        cdef tuple result
+
+        if cvalue:
+            self.hits += 1
+            self.operations += 1
+            # For a MultipleValues entry, this is a new copy that we
+            # own; claim it like SingleValue.from_entry does so that
+            # releasing it frees it (cached entries are left alone).
+            cvalue.Py_use[SVCacheEntry]()
+            try:
+                result = (bytes_from_pickle(cvalue), cvalue.tid())
+            finally:
+                release_entry(&cvalue)
+            return result
+
+        self.misses += 1
+        return None
+
     def __setitem__(self, OID_t key, tuple value):
         self._do_set(key, value[0], value[1])
 
@@ -424,7 +473,7 @@ cdef class PyCache:
             except RuntimeError as e:
                 raise CacheConsistencyError(str(e))
 
-        self.sets += 1
+        self.operations += 1
 
     def __delitem__(self, OID_t key):
         self.cache.delitem(key)
@@ -490,6 +539,28 @@ cdef class PyCache:
             yield python_from_entry(deref(it))
             preincr(it)
 
+    def iter_newest_values(self, current_tids):
+        """
+        Iterate ``(oid, tid, frozen, state, frequency)`` rows for the
+        newest value of each OID that is newer than the TID found for
+        the OID in the mapping *current_tids* (OIDs not in the mapping are
+        always included).
+
+        This walks the C++ entries directly; no :class:`CachedValue`
+        is created for single values, and the state isn't fetched
+        for entries that are skipped.
+
+        Not thread safe.
+        """
+        get_current_tid = current_tids.get
+        it = self.cache.begin()
+        end = self.cache.end()
+
+        while it != end:
+            if deref(it).newest_tid() > get_current_tid(deref(it).key, -1):
+                yield newest_value_row(deref(it))
+            preincr(it)
+
     # Cache specific operations
 
     cpdef set_all_for_tid(self, TID_t tid_int, state_oid_iter, compress, Py_ssize_t value_limit):
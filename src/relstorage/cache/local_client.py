@@ -16,7 +16,6 @@ from __future__ import division
 from __future__ import print_function
 
 import bz2
-import time
 import zlib
 
 
@@ -30,6 +29,7 @@ from relstorage._util import timer as _timer
 from relstorage._util import log_timed as _log_timed
 from relstorage._util import consume
 from relstorage._compat import OID_TID_MAP_TYPE as OidTMap
+from relstorage._compat import perf_counter
 from relstorage.interfaces import Int
 
 from relstorage.cache.interfaces import IStateCache
@@ -190,6 +190,8 @@ class LocalClient(object):
 
     # Things copied from self._cache
     _peek = None
+    _get_state_and_tid = None
+    _peek_item_with_tid = None
 
     def __init__(self, options,
                  prefix=None):
@@ -239,10 +241,10 @@ class LocalClient(object):
         return self._cache.keys()
 
     def _decompress(self, data):
-        pfx = data[:2]
-        if pfx not in self._decompression_functions:
+        decompress = self._decompression_functions.get(data[:2])
+        if decompress is None:
             return data
-        return self._decompression_functions[pfx](data[2:])
+        return decompress(data[2:])
 
     def _compress(self, data): # pylint:disable=method-hidden
         # We override this if we're disabling compression
@@ -332,6 +334,8 @@ class LocalClient(object):
                 byte_limit * self._gen_probation_pct
             )
         self._peek = self._cache.peek
+        self._get_state_and_tid = self._cache.get_state_and_tid
+        self._peek_item_with_tid = self._cache.peek_item_with_tid
         self.reset_stats()
 
     def reset_stats(self):
@@ -360,13 +364,11 @@ class LocalClient(object):
     def get(self, oid_tid, peek=False):
         oid, tid = oid_tid
         assert tid is None or tid >= 0
-        decompress = self._decompress
-        value = None
 
         if peek:
-            value = self._cache.peek_item_with_tid(oid, tid)
+            value = self._peek_item_with_tid(oid, tid)
         else:
-            value = self._cache.get_item_with_tid(oid, tid)
+            value = self._get_state_and_tid(oid, tid)
 
         # Finally, decompress if needed.
         # Recall that for deleted objects, `state` can be None.
@@ -374,7 +376,7 @@ class LocalClient(object):
         # don't need to decompress.
         if value is not None:
             state, tid = value
-            return ((decompress(state) if state else state), tid)
+            return ((self._decompress(state) if state else state), tid)
 
     __getitem__ = get
 
@@ -394,20 +396,24 @@ class LocalClient(object):
         # We don't take a lock to do this; it's fine if two threads
         # attempt it at the same time.
         age_period = self._age_factor * len(self._cache)
-        operations = self._cache.hits + self._cache.sets
+        operations = self._cache.operations
         if operations - self._aged_at < age_period:
-            self._next_age_at = age_period
+            # _next_age_at is compared against the total operation
+            # count, so it must be absolute; otherwise every set
+            # until the next aging would come back here.
+            self._next_age_at = self._aged_at + age_period
             return
         if self.size < self.limit:
+            # Likewise, don't check again on every set while we fill.
+            self._next_age_at = operations + age_period
             return
 
         self._aged_at = operations
-        now = time.time()
         logger.debug("Beginning frequency aging for %d cache entries",
                      len(self._cache))
-        self._cache.age_frequencies()
-        done = time.time()
-        logger.debug("Aged %d cache entries in %s", len(self._cache), done - now)
+        with _timer() as t:
+            self._cache.age_frequencies()
+        logger.debug("Aged %d cache entries in %s", len(self._cache), t.duration)
 
         self._next_age_at = int(self._aged_at * 1.5) # in case the dict shrinks
 
@@ -428,10 +434,11 @@ class LocalClient(object):
 
     def set_all_for_tid(self, tid_int, state_oid_iter):
         if self.limit:
-            self._cache.set_all_for_tid(tid_int, state_oid_iter, self._compress, self._value_limit)
+            cache = self._cache
+            cache.set_all_for_tid(tid_int, state_oid_iter, self._compress, self._value_limit)
             # Inline some of the logic about whether to age or not; avoiding the
             # call helps speed
-            if self._cache.hits + self._cache.sets > self._next_age_at:
+            if cache.operations > self._next_age_at:
                 self._age()
 
     def __delitem__(self, oid_tid):
@@ -474,7 +481,7 @@ class LocalClient(object):
 
         This can only be done in an empty cache.
         """
-        now = time.time()
+        now = perf_counter()
         mem_usage_before = mem_usage_before if mem_usage_before is not None else get_memory_usage()
         mem_usage_before_this = get_memory_usage()
         log_count = log_count or len(keys_and_values)
@@ -487,7 +494,7 @@ class LocalClient(object):
             keys_and_values,
             return_count_only=True)
 
-        then = time.time()
+        then = perf_counter()
         del keys_and_values # For memory reporting.
         mem_usage_after = get_memory_usage()
         logger.info(
@@ -501,6 +508,37 @@ class LocalClient(object):
         return log_count, stored
 
 
+    @_log_timed
+    def _fetch_and_filter_rows(self, db):
+        # Called as an argument so that we don't have the result
+        # in a local variable and it can be collected
+        # before we measure the memory delta.
+        #
+        # In large benchmarks, this function accounts for 57%
+        # of the total time to load data. 26% of the total is
+        # fetching rows from sqlite, and 18% of the total is allocating
+        # storage for the blob state.
+        #
+        # We make one call into sqlite and let it handle the iterating.
+        # Items are (oid, key_tid, state, actual_tid).
+        # key_tid may equal the actual tid, or be -1 when the row was previously
+        # frozen;
+        # That doesn't matter to us, we always freeze all rows.
+        size = 0
+        limit = self.limit
+        items = []
+        append = items.append
+        rows = db.fetch_rows_by_priority()
+        for oid, frozen, state, actual_tid, frequency in rows:
+            size += len(state)
+            if size > limit:
+                break
+            append((oid, (state, actual_tid, frozen, frequency)))
+        consume(rows)
+        # Rows came to us MRU to LRU, but we need to feed them the other way.
+        items.reverse()
+        return items
+
     @_log_timed
     def read_from_sqlite(self, connection):
         import gc
@@ -510,39 +548,9 @@ class LocalClient(object):
         db = Database.from_connection(connection)
         checkpoints = db.checkpoints
 
-        @_log_timed
-        def fetch_and_filter_rows():
-            # Do this here so that we don't have the result
-            # in a local variable and it can be collected
-            # before we measure the memory delta.
-            #
-            # In large benchmarks, this function accounts for 57%
-            # of the total time to load data. 26% of the total is
-            # fetching rows from sqlite, and 18% of the total is allocating
-            # storage for the blob state.
-            #
-            # We make one call into sqlite and let it handle the iterating.
-            # Items are (oid, key_tid, state, actual_tid).
-            # key_tid may equal the actual tid, or be -1 when the row was previously
-            # frozen;
-            # That doesn't matter to us, we always freeze all rows.
-            size = 0
-            limit = self.limit
-            items = []
-            rows = db.fetch_rows_by_priority()
-            for oid, frozen, state, actual_tid, frequency in rows:
-                size += len(state)
-                if size > limit:
-                    break
-                items.append((oid, (state, actual_tid, frozen, frequency)))
-            consume(rows)
-            # Rows came to us MRU to LRU, but we need to feed them the other way.
-            items.reverse()
-            return items
-
         # In the large benchmark, this is 25% of the total time.
         # 18% of the total time is preallocating the entry nodes.
-        self._bulk_update(fetch_and_filter_rows(),
+        self._bulk_update(self._fetch_and_filter_rows(db),
                           source=connection,
                           mem_usage_before=mem_before)
         return checkpoints
@@ -588,38 +596,21 @@ class LocalClient(object):
 
         # The *object_index* is our best polling data; anything it has it gospel,
         # so if it has an entry for an object, it superceeds our own.
-        get_current_oid_tid = stored_oid_tid.get
-        matching_tid_count = 0
+        #
+        # If we have something >= min_allowed, matching what's in the
+        # database, or even older (somehow), it's not worth writing
+        # to the database (states should be identical); the cache
+        # skips those rows for us while it walks its entries.
+        written_count = 0
         # When we accumulate all the rows here before returning them,
         # this function shows as about 3% of the total time to save
         # in a very large database.
         with _timer() as t:
-            for oid, lru_entry in self._cache.iteritems():
-                newest_value = lru_entry.newest_value
-                # We must have something at least this fresh
-                # to consider writing it out
-                if newest_value is None:
-                    raise AssertionError("Value should not be none", oid, lru_entry)
-                actual_tid = newest_value.tid
-
-                # If we have something >= min_allowed, matching
-                # what's in the database, or even older (somehow),
-                # it's not worth writing to the database (states should be identical).
-                current_tid = get_current_oid_tid(oid, -1)
-                if current_tid >= actual_tid:
-                    matching_tid_count += 1
-                    continue
-
-                yield (oid, actual_tid, newest_value.frozen,
-                       bytes(newest_value.state),
-                       lru_entry.frequency)
-
-                # We're able to satisfy this, so we don't need to consider
-                # it in our min_allowed set anymore.
-                # XXX: This isn't really the right place to do this.
-                # Move this and write a test.
-
+            for row in self._cache.iter_newest_values(stored_oid_tid):
+                written_count += 1
+                yield row
 
+        matching_tid_count = all_entries_len - written_count
         removed_entry_count = matching_tid_count
         logger.info(
             "Storing persistent cache: Examined %d entries and rejected %d "
@@ -637,7 +628,7 @@ class LocalClient(object):
         cur = connection.cursor()
 
         db = Database.from_connection(connection)
-        begin = time.time()
+        begin = perf_counter()
 
         # In a large benchmark, store_temp() accounts for 32%
         # of the total time, while move_from_temp accounts for 49%.
@@ -650,7 +641,7 @@ class LocalClient(object):
         with _timer() as batch_timer:
             cur.execute('BEGIN')
             stored_oid_tid = db.oid_to_tid
-            fetch_current = time.time()
+            fetch_current = perf_counter()
             count_written, _ = db.store_temp(self._items_to_write(stored_oid_tid))
             cur.execute("COMMIT")
 
@@ -734,8 +725,11 @@ class LocalClient(object):
         # We're probably shutting down, don't perform a GC; we see
         # that can get quite lengthy.
 
-        end = time.time()
-        stats = self.stats()
+        end = perf_counter()
+        # Don't build the whole stats() dict just for the log message.
+        hits = self._cache.hits
+        misses = self._cache.misses
+        total = hits + misses
         mem_after = get_memory_usage()
         logger.info(
             "Wrote %d items to %s in %s "
@@ -746,6 +740,6 @@ class LocalClient(object):
             fetch_current - begin, batch_timer.duration, rows_inserted, exclusive_timer.duration,
             trim_timer.duration,
             byte_display(mem_after - mem_before), self._cache,
-            stats['hits'], stats['misses'], stats['ratio'], stats['sets'])
+            hits, misses, hits / total if total else 0, self._cache.sets)
 
         return count_written
@@ -28,10 +28,10 @@ from contextlib import closing
 import sqlite3
 
 from relstorage._compat import ABC
+from relstorage._compat import PY3
 from relstorage._compat import OID_TID_MAP_TYPE
 from relstorage._util import log_timed
 
-from relstorage.adapters.sqlite.batch import Sqlite3RowBatcher
 from relstorage.adapters.sqlite.dialect import SQ3_SUPPORTS_UPSERT as SUPPORTS_UPSERT
 
 
@@ -161,12 +161,16 @@ class Database(ABC):
 
     def _remove_invalid_persistent_oids(self, bad_oids, cur):
         cur.execute("BEGIN")
-        batch = Sqlite3RowBatcher(cur)
-        for oid in bad_oids:
-            batch.delete_from('object_state', zoid=oid)
-        batch.flush()
+        rows_deleted = self._delete_oids([(oid,) for oid in bad_oids], cur)
         cur.execute("COMMIT")
-        return batch.total_rows_deleted
+        return rows_deleted
+
+    @staticmethod
+    def _delete_oids(oid_rows, cur):
+        # Like the RowBatcher we used to use, this reports the number
+        # of rows we asked to delete, not the number actually deleted.
+        cur.executemany('DELETE FROM object_state WHERE zoid = ?', oid_rows)
+        return len(oid_rows)
 
     def remove_invalid_persistent_oids(self, bad_oids):
         # The database might be locked by others, either someone in
@@ -217,7 +221,6 @@ class Database(ABC):
         # However, that seems to generate a poor query plan that actually looks
         # at all the rows (it doesn't understand that cum_size can only increase.)
         # Plus, window functions were only added to sqlite 3.25
-        as_state = bytes # Py2 returns buffers, Py3 returns bytes. bytes(bytes) is a no-op.
         cur = self.connection.cursor()
         cur.arraysize = 100
         cur.execute("""
@@ -226,8 +229,19 @@ class Database(ABC):
             FROM object_state
             ORDER BY frequency DESC, tid DESC
         """)
-        for zoid, frozen, state, tid, frequency in cur:
-            yield zoid, frozen, as_state(state), tid, frequency
+        if PY3:
+            # Py3 returns bytes for the BLOB, so the rows are already
+            # in the shape we want. Iterating the cursor directly lets
+            # sqlite build each row tuple in C, instead of
+            # round-tripping every row through a Python generator
+            # frame just to rebuild it.
+            return cur
+        # Py2 returns buffers.
+        return (
+            (zoid, frozen, bytes(state), tid, frequency)
+            for zoid, frozen, state, tid, frequency
+            in cur
+        )
 
     @log_timed
     def list_rows_by_priority(self):
@@ -267,14 +281,15 @@ class Database(ABC):
         # We can add a CAST(state as BLOB), or we could set the
         # connection's text_factory to bytes (which makes the metadata
         # bytes too).
-        rows = list(rows) # materialize
+        # executemany() consumes the iterator itself, and sums the
+        # rowcount across all the rows it inserted.
         self.cursor.executemany(
             'INSERT INTO temp_state(zoid, tid, was_frozen, state, frequency) '
             'VALUES (?, ?, ?, ?, ?)',
             rows
         )
 
-        return len(rows), -1
+        return self.cursor.rowcount, -1
 
     @abstractmethod
     def move_from_temp(self):
@@ -355,15 +370,10 @@ class Database(ABC):
         # We could probably use a window function over SUM(LENGTH(state))
         # to limit the select to just the rows we want.
 
-        # We'll be interleaving statements so we must use a
-        # separate cursor
-        batch_cur = self.connection.cursor()
-        batch = Sqlite3RowBatcher(batch_cur)
-
-        # In fact, because of the way PyPy wants you to fetch all rows
+        # Because of the way PyPy wants you to fetch all rows
         # or it considers some statements to still be open and thus
-        # refuses to allow things like VACUUM, we need to use two
-        # cursors, so we can close the fetch cursor too
+        # refuses to allow things like VACUUM, we use a separate
+        # cursor that we can close.
         fetch_cur = self.connection.cursor()
         fetch_cur.execute("""
         SELECT zoid, LENGTH(state)
@@ -372,16 +382,16 @@ class Database(ABC):
         """)
 
 
+        to_delete = []
         for row in fetch_cur:
             zoid, size = row
             how_much_to_trim -= size
-            batch.delete_from('object_state', zoid=zoid)
+            to_delete.append((zoid,))
             if how_much_to_trim <= 0:
                 break
-        batch.flush()
-        batch_cur.close()
         fetch_cur.close()
-        return batch.total_rows_deleted
+
+        return self._delete_oids(to_delete, self.cursor)
 
 class _UpsertUpdateDatabase(Database):
 
@@ -22,15 +22,19 @@ from __future__ import division
 from __future__ import print_function
 
 import importlib
+import struct
 
-from ZODB.utils import p64
-from ZODB.utils import u64
 from zope import interface
 
 from relstorage._compat import string_types
 from relstorage._compat import iteritems
 from relstorage.cache.interfaces import IStateCache
 
+# Values are stored as an 8-byte big-endian tid followed by the state.
+_TID_STRUCT = struct.Struct('>Q')
+_pack_tid = _TID_STRUCT.pack
+_unpack_tid = _TID_STRUCT.unpack_from
+
 
 @interface.implementer(IStateCache)
 class MemcacheStateCache(object):
@@ -62,38 +66,50 @@ class MemcacheStateCache(object):
         self._constructor = constructor
         self.prefix = prefix
         self.client = constructor()
+        # Format keys with a single operation; the prefix is
+        # escaped in case it contains a '%'.
+        self._state_key_tmpl = ('%s:state:' % (prefix,)).replace('%', '%%') + '%d:%d'
         # checkpoints_key holds the current checkpoints.
         self.checkpoints_key = ck = '%s:checkpoints' % self.prefix
         # no unicode on Py2
         assert isinstance(ck, str), (ck, type(ck))
 
     def __oid_tid_to_key(self, oid, tid):
-        return '%s:state:%d:%d' % (self.prefix, tid, oid)
+        return self._state_key_tmpl % (tid, oid)
 
-    def __getitem__(self, oid_tid, peek=False):
+    def __get_raw(self, oid_tid):
+        """
+        Return the raw cached value (tid bytes followed by state)
+        for *oid_tid*, or None if there isn't a valid one.
+        """
         oid, tid = oid_tid
         if tid is None:
             # We don't support frozen keys, only those in the index
             return None
 
-        cachekeys = [self.__oid_tid_to_key(oid, tid)]
-        response = self.client.get_multi(cachekeys) or {}
-        for key in cachekeys:
-            data = response.get(key)
-            if data and len(data) >= 8:
-                actual_tid_int = u64(data[:8])
-                return data[8:], actual_tid_int
+        # A plain get() of the one key; get_multi() would make the
+        # client build a response dict.
+        data = self.client.get(self.__oid_tid_to_key(oid, tid))
+        if data and len(data) >= 8:
+            return data
+
+    def __getitem__(self, oid_tid, peek=False):
+        data = self.__get_raw(oid_tid)
+        if data is not None:
+            actual_tid_int = _unpack_tid(data)[0]
+            return data[8:], actual_tid_int
 
     get = __getitem__
 
     def __contains__(self, oid_tid):
-        return self[oid_tid] is not None
+        # Don't copy the state out of the value just to discard it.
+        return self.__get_raw(oid_tid) is not None
 
     def __setitem__(self, oid_tid, state_bytes_tid):
         oid, tid = oid_tid
         key = self.__oid_tid_to_key(oid, tid)
         state_bytes, actual_tid = state_bytes_tid
-        cache_data = p64(actual_tid) + (state_bytes or b'')
+        cache_data = _pack_tid(actual_tid) + (state_bytes or b'')
         self.client.set(key, cache_data)
 
     def __delitem__(self, oid_tid):
@@ -106,20 +122,23 @@ class MemcacheStateCache(object):
         self.flush_all()
 
     def _set_multi(self, keys_and_values):
+        tmpl = self._state_key_tmpl
+        pack_tid = _pack_tid
         formatted = {
-            '%s:state:%d:%d' % (self.prefix, tid, oid): (p64(actual_tid) + (state or b''))
+            tmpl % (tid, oid): (pack_tid(actual_tid) + (state or b''))
             for (oid, tid), (state, actual_tid) in iteritems(keys_and_values)
         }
         self.client.set_multi(formatted)
 
     def set_all_for_tid(self, tid_int, state_oid_iter):
         send_size = 0
+        send_limit = self.send_limit
         to_send = {}
         for state, oid_int, _ in state_oid_iter:
             length = len(state)
             cachekey = (oid_int, tid_int)
             item_size = length + len(cachekey)
-            if send_size and send_size + item_size >= self.send_limit:
+            if send_size and send_size + item_size >= send_limit:
                 self._set_multi(to_send)
                 to_send.clear()
                 send_size = 0
@@ -111,9 +111,10 @@ class LocalClientStrKeysValuesGenerationalTests(TestCase):
         # Right now, we're one entry over size, because we put k5
         # in eden, which dropped k4 to probation; since probation was empty, we
         # allowed it to stay there
-        self.assertEqual(list_lrukeys('eden'), [5])
-        self.assertEqual(list_lrukeys('probation'), [4])
-        self.assertEqual(list_lrukeys('protected'), [3, 2, 1, 0])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [5], 'probation': [4], 'protected': [3, 2, 1, 0]}
+        )
         self.assertEqual(c._cache.weight, expected_weight(6, 60))
 
         v = c['22']
@@ -122,9 +123,10 @@ class LocalClientStrKeysValuesGenerationalTests(TestCase):
 
         del c[(1, 1)]
         c['11'] = b'b'
-        self.assertEqual(list_lrukeys('eden'), [1])
-        self.assertEqual(list_lrukeys('probation'), [5])
-        self.assertEqual(list_lrukeys('protected'), [2, 3, 0])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [1], 'probation': [5], 'protected': [2, 3, 0]}
+        )
 
         self.assertEqual(c._cache.weight, expected_weight(5, 41))
 
@@ -141,9 +143,10 @@ class LocalClientStrKeysValuesGenerationalTests(TestCase):
         # from whence they were ejected because of never being accessed.
         # k2 was allowed to remain because it'd been accessed
         # more often
-        self.assertEqual(list_lrukeys('eden'), [-3])
-        self.assertEqual(list_lrukeys('probation'), [-2])
-        self.assertEqual(list_lrukeys('protected'), [0, 2, 3])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [-3], 'probation': [-2], 'protected': [0, 2, 3]}
+        )
         self.assertEqual(c._cache.weight, expected_weight(5, 50))
 
         #pprint.pprint(c._cache.stats())
@@ -156,9 +159,10 @@ class LocalClientStrKeysValuesGenerationalTests(TestCase):
         # Note that this last set of checks perturbed protected and probation;
         # We lost a key
         #pprint.pprint(c._cache.stats())
-        self.assertEqual(list_lrukeys('eden'), [-3])
-        self.assertEqual(list_lrukeys('probation'), [])
-        self.assertEqual(list_lrukeys('protected'), [2, -2, 0, 3])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [-3], 'probation': [], 'protected': [2, -2, 0, 3]}
+        )
 
 
         self.assertEqual(c['00'], b'0123456789')
@@ -171,14 +175,16 @@ class LocalClientStrKeysValuesGenerationalTests(TestCase):
 
         # Let's promote from probation, causing places to switch.
         # First, verify our current state after those gets.
-        self.assertEqual(list_lrukeys('eden'), [-3])
-        self.assertEqual(list_lrukeys('probation'), [])
-        self.assertEqual(list_lrukeys('protected'), [3, 2, 0, -2])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [-3], 'probation': [], 'protected': [3, 2, 0, -2]}
+        )
         # Now get and switch
         c.__getitem__((-2, 2))
-        self.assertEqual(list_lrukeys('eden'), [-3])
-        self.assertEqual(list_lrukeys('probation'), [])
-        self.assertEqual(list_lrukeys('protected'), [-2, 3, 2, 0])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [-3], 'probation': [], 'protected': [-2, 3, 2, 0]}
+        )
 
 
         # Confirm frequency counts
@@ -191,9 +197,10 @@ class LocalClientStrKeysValuesGenerationalTests(TestCase):
 
         # Now, because we had accessed k0 (probation) more than we'd
         # accessed the last key from eden (x3), that's the one we keep
-        self.assertEqual(list_lrukeys('eden'), [100])
-        self.assertEqual(list_lrukeys('probation'), [-3])
-        self.assertEqual(list_lrukeys('protected'), [-2, 3, 2, 0])
+        self.assertEqual(
+            all_lrukeys(),
+            {'eden': [100], 'probation': [-3], 'protected': [-2, 3, 2, 0]}
+        )
 
         self.assertEqual(list_lrufreq('eden'), [1])
         self.assertEqual(list_lrufreq('probation'), [2])
@@ -260,6 +267,26 @@ class LocalClientOIDTests(AbstractStateCacheTests):
         c[self.key] = (b'abcdefgh' * 10000, self.key_tid)
         self.assertEqual(c[self.key], None)
 
+    def test_age_is_not_checked_on_every_set(self):
+        c = self._makeOne()
+        calls = []
+        age = c._age
+        def count_age():
+            calls.append(1)
+            return age()
+        c._age = count_age
+
+        for i in range(10):
+            c[(i, 1)] = (b'abc', 1)
+        for _ in range(2000):
+            c.get((0, 1))
+        # We've done enough operations to want to age, but we're
+        # not full, so nothing happens...
+        for i in range(10, 60):
+            c[(i, 1)] = (b'abc', 1)
+        # ...and we only had to decide that once.
+        self.assertEqual(len(calls), 1)
+
     def test_set_with_zero_space(self):
         c = self._makeOne(cache_local_mb=0)
         self.assertEqual(c.limit, 0)
@@ -275,7 +302,11 @@ class LocalClientOIDTests(AbstractStateCacheTests):
         import shutil
         import os
 
-        root_temp_dir = tempfile.mkdtemp(".rstest_cache")
+        # Prefer a RAM-backed directory when there is one; this test
+        # is about the files we create, not their durability.
+        root_temp_dir = tempfile.mkdtemp(
+            ".rstest_cache",
+            dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
         self.addCleanup(shutil.rmtree, root_temp_dir, True)
         # Intermediate directories will be auto-created
         temp_dir = os.path.join(root_temp_dir, 'child1', 'child2')
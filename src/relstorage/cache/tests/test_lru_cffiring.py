@@ -15,6 +15,7 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import unittest
 
 from hamcrest import assert_that
 from nti.testing.matchers import validly_provides
@@ -26,6 +27,7 @@ from nti.testing.matchers import validly_provides
 # over the object layout, especially with the various MSVC compilers
 # we have to deal with. So that explains the tests that have a range of sizes.
 
+from relstorage._compat import PYPY
 from relstorage.tests import TestCase
 from relstorage.cache import interfaces
 from . import Cache
@@ -229,6 +231,55 @@ class GenericLRUCacheTests(TestCase):
         self.assertEqual(b'abc', entry.value)
         self.assertEqual(2, entry.frequency)
 
+    def test_iter_newest_values(self):
+        cache = self._makeOne(100)
+        cache[1] = (b'abc', 1)
+        cache[2] = (b'def', 1)
+        # Now a multiple value.
+        cache[2] = (b'ghi', 2)
+        cache.freeze({1: 1})
+
+        rows = sorted(cache.iter_newest_values({}))
+        self.assertEqual(rows, [
+            (1, 1, True, b'abc', 1),
+            (2, 2, False, b'ghi', 2),
+        ])
+
+        # Things no newer than what's known are skipped.
+        rows = list(cache.iter_newest_values({1: 1, 2: 1}))
+        self.assertEqual(rows, [(2, 2, False, b'ghi', 2)])
+        self.assertEqual([], list(cache.iter_newest_values({1: 2, 2: 3})))
+
+    def test_get_state_and_tid(self):
+        cache = self._makeOne(100)
+        cache[1] = (b'abc', 1)
+        cache[1] = (b'def', 2)
+        cache.reset_stats()
+
+        self.assertEqual(cache.get_state_and_tid(1, 1), (b'abc', 1))
+        self.assertEqual(cache.get_state_and_tid(1, 2), (b'def', 2))
+        self.assertIsNone(cache.get_state_and_tid(1, 3))
+        self.assertIsNone(cache.get_state_and_tid(2, None))
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 2)
+
+    @unittest.skipIf(PYPY, "States are copied to native strings; refcounts are meaningless")
+    def test_get_state_and_tid_frees_copies(self):
+        import sys
+        cache = self._makeOne(1000)
+        # Use states that aren't interned or shared with anything else.
+        state1 = b'abc' * 10
+        state2 = b'def' * 10
+        cache[1] = (state1, 1)
+        cache[1] = (state2, 2)
+        # This entry now has multiple values; each lookup copies out
+        # a new entry holding a reference to the state, which must
+        # be released again.
+        before = sys.getrefcount(state1)
+        for _ in range(10):
+            self.assertEqual(cache.get_state_and_tid(1, 1), (state1, 1))
+        self.assertEqual(sys.getrefcount(state1), before)
+
     def test_add_too_many_MRUs_works_aronud_big_entry(self):
         cache = self._getClass()(20)
         base_size = cache.base_size
@@ -90,3 +90,18 @@ class MemcacheClientTests(AbstractStateCacheTests):
         inst = self._makeOne()
         new = inst.new_instance()
         self.assertIsNot(inst, new)
+
+    def test_prefix_with_percent(self):
+        from relstorage.tests.fakecache import data
+        options = self.Options.from_args()
+        inst = self.getClass()(options, prefix='my%sprefix')
+        inst[(2, 55)] = (b'abc', 55)
+        self.assertIn('my%sprefix:state:55:2', data)
+        self.assertEqual(inst[(2, 55)], (b'abc', 55))
+
+    def test_contains(self):
+        c = self._makeOne()
+        c[(2, 55)] = (b'abc', 55)
+        self.assertIn((2, 55), c)
+        self.assertNotIn((2, 56), c)
+        self.assertNotIn((2, None), c)